@@ -1,17 +1,32 @@
-import re
-import ast
+import sys
 import numpy
 
 from maya import cmds as mc
-from . import asciibase
+from types import MappingProxyType
+from . import asciibase, asciidata
 from .asciiplug import AsciiPlugType
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+# Prefer google's linear-time DFA engine when it's available
+# Otherwise fallback on the builtin backtracking engine
+#
+try:
+
+    import re2 as re
+
+except ImportError:
+
+    import re
+    log.debug('Unable to locate re2 module, falling back on re module!')
+
+
+__states__ = frozenset(['yes', 'on', 'true'])
+
+
 def state(value):
     """
     Evaluates the state string and converts it to a boolean.
@@ -20,7 +35,7 @@ def state(value):
     :rtype: bool
     """
 
-    return value in ('yes', 'on', 'true')
+    return value in __states__
 
 
 class AsciiFlagParser(asciibase.AsciiBase):
@@ -28,7 +43,7 @@ class AsciiFlagParser(asciibase.AsciiBase):
     Ascii class used to translate command flags.
     """
 
-    __slots__ = ('shortName', 'longName', 'dataType', 'multiUse')
+    __slots__ = ('shortName', 'longName', 'dataType', 'multiUse', '_toString', '_fromString')
 
     __datatypes__ = {
         'String': str,
@@ -49,8 +64,8 @@ class AsciiFlagParser(asciibase.AsciiBase):
 
         # Declare class variables
         #
-        self.shortName = args[0]
-        self.longName = args[1]
+        self.shortName = sys.intern(args[0])
+        self.longName = sys.intern(args[1])
         self.dataType = None
         self.multiUse = False
 
@@ -71,6 +86,26 @@ class AsciiFlagParser(asciibase.AsciiBase):
 
             pass
 
+        # Specialize string conversions based on data type
+        # This avoids having to evaluate the data type on every call
+        #
+        shortName = self.shortName
+
+        if self.dataType is None:
+
+            self._toString = lambda value: shortName
+            self._fromString = lambda value: None
+
+        elif self.dataType is str:
+
+            self._toString = lambda value: f'{shortName} "{value}"'
+            self._fromString = self.dataType
+
+        else:
+
+            self._toString = lambda value: f'{shortName} {str(value).lower()}'
+            self._fromString = self.dataType
+
     def hasValue(self):
         """
         Evaluates whether this flag expects a value.
@@ -88,17 +123,7 @@ class AsciiFlagParser(asciibase.AsciiBase):
         :rtype: str
         """
 
-        if self.dataType is None:
-
-            return self.shortName
-
-        elif self.dataType is str:
-
-            return f'{self.shortName} "{value}"'
-
-        else:
-
-            return f'{self.shortName} {str(value).lower()}'
+        return self._toString(value)
 
     def fromString(self, value):
         """
@@ -108,13 +133,7 @@ class AsciiFlagParser(asciibase.AsciiBase):
         :rtype: object
         """
 
-        if self.dataType is None:
-
-            return None
-
-        else:
-
-            return self.dataType(value)
+        return self._fromString(value)
 
 
 class AsciiArgParser(asciibase.AsciiBase):
@@ -124,12 +143,15 @@ class AsciiArgParser(asciibase.AsciiBase):
     All arguments are dequoted at runtime.
     """
 
-    __slots__ = ('_name', 'syntax', 'arguments', 'flags')
+    __slots__ = ('_name', '_command', '_arguments', '_flags', 'syntax')
     __syntax__ = {}
+    __parsers__ = {}
     __quotation__ = '"'
-    __command__ = re.compile(r'("(?:[^"\\]|\\.)*"|(?:-{1}[a-zA-Z]+)+|(?:[+-])?(?:[0-9])+(?:\.{1}[0-9]+)?(?:e{1}[\-\+]{1}[0-9]+)?|\w+)')
-    __flag__ = re.compile(r'^(-+[a-zA-Z]+)$')
-    __number__ = re.compile(r'(?:[+-])?(?:[0-9])+(?:\.{1}[0-9]+)?(?:e{1}\-{1}[0-9]+)?')
+    __escape__ = '\\'
+    __punctuation__ = ';:{},'
+    __operators__ = frozenset(['(', '+', ')'])  # Used to concatenate long strings
+    __command__ = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*"|[^\s";:{},](?:[^\s"]*[^\s";:{},])?)')  # Unquoted tokens mirror the whitespace split with punctuation stripped
+    __number__ = re.compile(r'[+-]?[0-9]+(?:\.[0-9]+)?(?:e-[0-9]+)?')
 
     def __init__(self, *args, **kwargs):
         """
@@ -146,12 +168,13 @@ class AsciiArgParser(asciibase.AsciiBase):
         # Declare private variables
         #
         self._name = ''
+        self._command = None
+        self._arguments = []
+        self._flags = {}
 
         # Declare public variables
         #
         self.syntax = {}
-        self.arguments = []
-        self.flags = {}
 
         # Check supplied arguments
         #
@@ -206,13 +229,16 @@ class AsciiArgParser(asciibase.AsciiBase):
         if isinstance(key, int):
 
             # Check if array should be expanded
+            # Slice assignment grows the list in place with a single resize
             #
-            if key >= self.numArguments:
+            arguments = self.arguments
+            numArguments = len(arguments)
+
+            if key >= numArguments:
 
-                diff = (key + 1) - self.numArguments
-                self.arguments.extend([None] * diff)
+                arguments[numArguments:] = [None] * ((key + 1) - numArguments)
 
-            self.arguments[key] = value
+            arguments[key] = value
 
         elif isinstance(key, str):
 
@@ -267,17 +293,100 @@ class AsciiArgParser(asciibase.AsciiBase):
     def command(self, command):
         """
         Setter method updates the command string.
+        Only the command name is evaluated, the arguments and flags are parsed on demand.
 
         :type command: str
         :rtype: None
         """
 
+        # Extract command name from string
+        # Be sure to store the command after updating the name since the setter clears it!
+        #
+        self.name = command.split(None, 1)[0].strip(self.__punctuation__)
+        self._command = command
+
+    @property
+    def arguments(self):
+        """
+        Getter method that returns the arguments of this command.
+
+        :rtype: list[str]
+        """
+
+        if self._command is not None:
+
+            self.parse()
+
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, arguments):
+        """
+        Setter method that updates the arguments of this command.
+
+        :type arguments: list[str]
+        :rtype: None
+        """
+
+        if self._command is not None:
+
+            self.parse()
+
+        self._arguments = arguments
+
+    @property
+    def flags(self):
+        """
+        Getter method that returns the flags of this command.
+
+        :rtype: dict[str, Any]
+        """
+
+        if self._command is not None:
+
+            self.parse()
+
+        return self._flags
+
+    @flags.setter
+    def flags(self, flags):
+        """
+        Setter method that updates the flags of this command.
+
+        :type flags: dict[str, Any]
+        :rtype: None
+        """
+
+        if self._command is not None:
+
+            self.parse()
+
+        self._flags = flags
+
+    def parse(self):
+        """
+        Parses the arguments and flags from the pending command string.
+
+        :rtype: None
+        """
+
+        # Check if there's a pending command
+        #
+        command = self._command
+
+        if command is None:
+
+            return
+
         # Collect arguments and flags from string
+        # Be sure to skip the command name!
         #
+        self._command = None
+
         arguments = self.split(command)
+        del arguments[0]
 
-        self.name = arguments.pop(0)
-        self.arguments, self.flags = self.strip(arguments, syntax=self.syntax)
+        self._arguments, self._flags = self.strip(arguments, syntax=self.syntax)
 
     @property
     def name(self):
@@ -304,8 +413,9 @@ class AsciiArgParser(asciibase.AsciiBase):
 
         # Clear previous arguments
         #
-        self.arguments.clear()
-        self.flags.clear()
+        self._command = None
+        self._arguments = []
+        self._flags = {}
 
         # Get associated command syntax
         #
@@ -315,53 +425,95 @@ class AsciiArgParser(asciibase.AsciiBase):
     def split(cls, line):
         """
         Splits the given a command string into arguments.
+        Lines without any escape characters are scanned using the quotation marks instead of regex.
 
         :type line: str
         :rtype: list[str]
         """
 
-        return [cls.dequote(x.group(0)) for x in cls.__command__.finditer(line) if x]
+        # Check if line can be scanned using quotation marks
+        # Escaped or unbalanced quotes require the regex tokenizer!
+        #
+        segments = line.split(cls.__quotation__)
+        numSegments = len(segments)
+
+        if cls.__escape__ in line or (numSegments % 2) == 0:
+
+            # Only the quoted alternative can produce a token starting with a quotation mark
+            # So there's no need to check the end of each token!
+            #
+            quotation = cls.__quotation__
+            operators = cls.__operators__
+
+            return [x[1:-1] if x[0] == quotation else x for x in cls.__command__.findall(line) if x not in operators]
+
+        # Iterate through segments
+        # Even segments contain unquoted arguments while odd segments contain quoted strings
+        #
+        arguments = []
+        operators = cls.__operators__
+
+        for (i, segment) in enumerate(segments):
+
+            if i % 2:
+
+                arguments.append(segment)
+
+            else:
+
+                arguments.extend([x for x in (y.strip(cls.__punctuation__) for y in segment.split()) if x and x not in operators])
+
+        return arguments
 
     @classmethod
     def strip(cls, arguments, syntax=None):
         """
         Strips any flags from the supplied arguments and returns them in a dictionary.
 
-        :type arguments: deque
+        :type arguments: list[str]
         :type syntax: dict
         :rtype: list, dict
         """
 
-        # Iterate through known flags
-        # Be sure to do this in reverse to avoid any index errors
+        # Iterate through arguments
+        # Flags and their values are consumed in a single forward pass
         #
         numArguments = len(arguments)
+        remaining = []
         flags = {}
 
-        for i in range(numArguments - 1, -1, -1):
+        index = 0
+
+        while index < numArguments:
 
             # Check if argument is a flag
             #
-            argument = arguments[i]
+            argument = arguments[index]
 
             if not cls.isFlag(argument):
 
+                remaining.append(argument)
+                index += 1
+
                 continue
 
-            # Pop flag from list
+            # Check if flag expects a value
+            # Interning the flag lets any dictionary lookups compare by identity
             #
-            key = arguments.pop(i)
+            key = sys.intern(argument)
             parser = syntax[key]
 
             if parser.hasValue():
 
-                flags[key] = parser.fromString(arguments.pop(i))
+                flags[key] = parser.fromString(arguments[index + 1])
+                index += 2
 
             else:
 
                 flags[key] = True
+                index += 1
 
-        return arguments, flags
+        return remaining, flags
 
     @staticmethod
     def group(items, size=1):
@@ -391,17 +543,18 @@ class AsciiArgParser(asciibase.AsciiBase):
 
             # Check if this is a compound attribute
             # I found an edge case for vertex colours
+            # The rows are converted back to lists in bulk so the plugs don't have to iterate over array views!
             #
-            attribute = path[-1].attribute()
-            dataType = attribute.getDataType()
+            attribute = path[-1].attribute
+            arguments = self.arguments[1:]
 
             if attribute.attributeType == 'compound':
 
-                return numpy.array(self.arguments[1:], dtype=float).reshape([-1, attribute.numberOfChildren])
+                return numpy.fromiter(map(float, arguments), dtype=float, count=len(arguments)).reshape(-1, attribute.numberOfChildren).tolist()
 
             else:
 
-                return dataType.readAscii(self.arguments[1:])
+                return asciidata.readAscii(attribute, arguments)
 
         elif pathType == AsciiPlugType.kCompoundArray:
 
@@ -467,47 +620,60 @@ class AsciiArgParser(asciibase.AsciiBase):
     def asArray(self, sizeHint=0):
         """
         Organizes the arguments into a sequence of sparse array elements.
-        This syntax is mostly used for skin weights.
+        This syntax is mostly used for skin weights so all values are evaluated as floats.
 
-        :rtype: list[dict[int:Union[int,float]]]
+        :rtype: list[dict[int:float]]
         """
 
-        # Iterate through arguments
+        # Check if there are any arguments
         #
-        iterator = iter(self.arguments[1:])
-        items = [None] * sizeHint
-        index = 0
+        arguments = self.arguments[1:]
+        numArguments = len(arguments)
 
-        while True:
+        if numArguments == 0:
 
-            try:
+            return [None] * sizeHint
 
-                # Evaluate number of key-value pairs
-                #
-                numItems = int(next(iterator))
-                pairs = {}
+        # Check if every element has the same number of key-value pairs
+        # If so then the arguments can be converted in bulk
+        #
+        numItems = int(arguments[0])
+        stride = (numItems * 2) + 1
 
-                for i in range(0, numItems * 2, 2):
+        items = None
 
-                    key = int(next(iterator))
-                    value = ast.literal_eval(next(iterator))
+        if (numArguments % stride) == 0 and all([x == arguments[0] for x in arguments[::stride]]):
 
-                    pairs[key] = value
+            array = numpy.array(arguments).reshape(-1, stride)
+            keys = array[:, 1::2].astype(int).tolist()
+            values = array[:, 2::2].astype(float).tolist()
 
-                # Assign key-value pairs
-                #
-                try:
+            items = [dict(zip(x, y)) for (x, y) in zip(keys, values)]
 
-                    items[index] = pairs
-                    index += 1
+        else:
+
+            # Iterate through elements
+            #
+            items = []
+            index = 0
+
+            while index < numArguments:
 
-                except IndexError:
+                # Evaluate number of key-value pairs
+                #
+                start = index + 1
+                end = start + (int(arguments[index]) * 2)
 
-                    items.append(pairs)
+                items.append({int(key): float(value) for (key, value) in zip(arguments[start:end:2], arguments[start + 1:end:2])})
+                index = end
+
+        # Pad elements to match size hint
+        #
+        numElements = len(items)
 
-            except StopIteration:
+        if numElements < sizeHint:
 
-                break
+            items.extend([None] * (sizeHint - numElements))
 
         return items
 
@@ -517,7 +683,7 @@ class AsciiArgParser(asciibase.AsciiBase):
         Returns the syntax for the supplied command.
 
         :type command: str
-        :rtype: dict
+        :rtype: MappingProxyType
         """
 
         #  Check for redundancy
@@ -530,19 +696,35 @@ class AsciiArgParser(asciibase.AsciiBase):
 
         # Split help string
         #
-        syntax = {}
-
         docstring = mc.help(command, syntaxOnly=True)
         lines = [x.split() for x in docstring.split('\n')[2:] if len(x) > 0]
 
-        for line in lines:
+        numLines = len(lines)
+        parsers = [None] * numLines
+
+        for (i, line) in enumerate(lines):
+
+            # Check if an identical flag parser already exists
+            # Flag parsers are immutable so they can be shared between commands
+            #
+            key = tuple(line)
+            parser = cls.__parsers__.get(key, None)
+
+            if parser is None:
+
+                parser = AsciiFlagParser(*line)
+                cls.__parsers__[key] = parser
 
-            parser = AsciiFlagParser(*line)
-            syntax[parser.shortName] = parser
-            syntax[parser.longName] = parser
+            parsers[i] = parser
+
+        # Build read-only lookup from both flag names
+        # The syntax is shared between all parsers so it shouldn't be edited!
+        #
+        syntax = dict(zip([x.shortName for x in parsers], parsers))
+        syntax.update(zip([x.longName for x in parsers], parsers))
 
-        cls.__syntax__[command] = syntax
-        return syntax
+        cls.__syntax__[command] = MappingProxyType(syntax)
+        return cls.__syntax__[command]
 
     @property
     def numFlags(self):
@@ -563,7 +745,18 @@ class AsciiArgParser(asciibase.AsciiBase):
         :rtype: bool
         """
 
-        return cls.__flag__.match(item) and item != '-nan'
+        # Check if item starts with a hyphen
+        # Most arguments aren't flags so this avoids any unnecessary string operations!
+        #
+        if not item.startswith('-') or item == '-nan':
+
+            return False
+
+        # Check if the remaining characters are letters
+        #
+        name = item.lstrip('-')
+
+        return name.isascii() and name.isalpha()
 
     def getFlag(self, flag, default=None):
         """
@@ -594,11 +787,16 @@ class AsciiArgParser(asciibase.AsciiBase):
         :rtype: str
         """
 
-        flags = ' '.join([self.syntax[key].toString(value) for (key, value) in self.flags.items()])
-        arguments = ' '.join(self.arguments)
-        tabs = '\t' * indent
+        # Collect command pieces
+        # Everything is joined in one pass to avoid any intermediate strings
+        #
+        syntax = self.syntax
+
+        pieces = [('\t' * indent) + self.name]
+        pieces.extend([syntax[key].toString(value) for (key, value) in self.flags.items()])
+        pieces.extend(self.arguments)
 
-        return f"{tabs}{self.name} {flags} {arguments};"
+        return ' '.join(pieces) + ';'
 
     @classmethod
     def dequote(cls, value):
@@ -1,14 +1,108 @@
+import sys
+
 from maya.api import OpenMaya as om
 
 from . import asciitreemixin, asciiargparser, asciidata
-from .collections import hashtable, weakreflist, notifylist
+from .collections import hashtable
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+class AsciiFlagProperty(object):
+    """
+    Descriptor class used to expose an addAttr flag as a slot-backed property.
+    Reads and writes go straight to the instance slot, the parser is only updated once the command is requested.
+    """
+
+    __slots__ = ('name', 'slot', 'flag', 'default', 'interned')
+
+    def __init__(self, flag, default=None, interned=False):
+        """
+        Private method called after a new instance has been created.
+
+        :type flag: str
+        :type default: Any
+        :type interned: bool
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(AsciiFlagProperty, self).__init__()
+
+        # Declare public variables
+        # Flags are interned so parser lookups can short-circuit on identity!
+        #
+        self.name = ''
+        self.slot = ''
+        self.flag = sys.intern(flag)
+        self.default = default
+        self.interned = interned
+
+    def __set_name__(self, owner, name):
+        """
+        Private method called whenever this descriptor is assigned to a class.
+        The descriptor registers itself with the owner so the slots can be initialized in bulk.
+
+        :type owner: type
+        :type name: str
+        :rtype: None
+        """
+
+        self.name = name
+        self.slot = sys.intern(f'_{name}')
+
+        owner.__properties__ = owner.__dict__.get('__properties__', ()) + (self,)
+
+    def __get__(self, instance, owner):
+        """
+        Private method called whenever the user attempts to get a value.
+
+        :type instance: AsciiAttribute
+        :type owner: type
+        :rtype: Any
+        """
+
+        if instance is None:
+
+            return self
+
+        else:
+
+            return getattr(instance, self.slot)
+
+    def __set__(self, instance, value):
+        """
+        Private method called whenever the user attempts to update a value.
+
+        :type instance: AsciiAttribute
+        :type value: Any
+        :rtype: None
+        """
+
+        setattr(instance, self.slot, self.convert(value))
+        instance._dirty = True
+
+    def convert(self, value):
+        """
+        Returns the value that should be stored inside the instance slot.
+        Interned strings hash once and let dictionary lookups short-circuit on identity!
+
+        :type value: Any
+        :rtype: Any
+        """
+
+        if self.interned and isinstance(value, str):
+
+            return sys.intern(value)
+
+        else:
+
+            return value
+
+
 class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
     """
     Ascii class used to interface with attribute definitions.
@@ -20,9 +114,58 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         '_parent',
         '_children',
         '_parser',
-        '_dynamic'
+        '_dirty',
+        '_dynamic',
+        '_longName',
+        '_shortName',
+        '_niceName',
+        '_attributeType',
+        '_dataType',
+        '_readable',
+        '_writable',
+        '_storable',
+        '_cachedInternally',
+        '_multi',
+        '_indexMatters',
+        '_keyable',
+        '_channelBox',
+        '_hidden',
+        '_usedAsFilename',
+        '_usedAsColor',
+        '_minValue',
+        '_maxValue',
+        '_softMinValue',
+        '_softMaxValue',
+        '_defaultValue'
     )
 
+    __setters__ = {}  # Used to cache property setters
+
+    # Flag properties
+    # Each property reads from and writes to its slot, see AsciiAttribute.flush() for parser updates
+    #
+    longName = AsciiFlagProperty('-ln', interned=True)
+    shortName = AsciiFlagProperty('-sn', interned=True)
+    niceName = AsciiFlagProperty('-nn', default='')
+    attributeType = AsciiFlagProperty('-at')
+    dataType = AsciiFlagProperty('-dt')
+    readable = AsciiFlagProperty('-r', default=True)
+    writable = AsciiFlagProperty('-w', default=True)
+    storable = AsciiFlagProperty('-s', default=True)
+    cachedInternally = AsciiFlagProperty('-ci', default=True)
+    multi = AsciiFlagProperty('-m', default=False)
+    indexMatters = AsciiFlagProperty('-im', default=True)
+    keyable = AsciiFlagProperty('-k', default=False)
+    channelBox = AsciiFlagProperty('-cb', default=False)
+    hidden = AsciiFlagProperty('-h', default=False)
+    usedAsFilename = AsciiFlagProperty('-uaf', default=False)
+    usedAsColor = AsciiFlagProperty('-uac', default=False)
+    minValue = AsciiFlagProperty('-min')
+    maxValue = AsciiFlagProperty('-max')
+    softMinValue = AsciiFlagProperty('-smn')
+    softMaxValue = AsciiFlagProperty('-smx')
+    defaultValue = AsciiFlagProperty('-dv')
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -34,15 +177,11 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
 
         # Declare private variables
         #
-        self._parent = self.nullWeakReference
-        self._children = notifylist.NotifyList(cls=weakreflist.WeakRefList)
+        self._parent = None
+        self._children = asciitreemixin.AsciiChildList(self)
         self._parser = None
-        self._dynamic = kwargs.get('dynamic', True)
-
-        # Setup child notifies
-        #
-        self._children.addCallback('itemAdded', self.childAdded)
-        self._children.addCallback('itemRemoved', self.childRemoved)
+        self._dirty = False
+        self._dynamic = kwargs.pop('dynamic', True)
 
         # Check for any arguments
         #
@@ -56,11 +195,25 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
 
             self._parser = asciiargparser.AsciiArgParser('addAttr')
 
+        # Cache flag values from parser
+        # This avoids a flag lookup every time a property is accessed!
+        #
+        parser = self._parser
+
+        for descriptor in self.__properties__:
+
+            setattr(self, descriptor.slot, descriptor.convert(parser.getFlag(descriptor.flag, descriptor.default)))
+
         # Declare public variables
+        # The parent already defaults to a null reference so only assign it when supplied!
         #
-        self.parent = kwargs.get('parent', None)
+        parent = kwargs.pop('parent', None)
+
+        if parent is not None:
 
-        # Copy any properties from kwargs
+            self.parent = parent
+
+        # Copy any remaining properties from kwargs
         #
         self.update(kwargs)
 
@@ -71,7 +224,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: str
         """
 
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object: {self.longName}>'
+        return f'<{self.__module__}.{self.className} object: {self._longName}>'
 
     @property
     def parent(self):
@@ -81,7 +234,10 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: AsciiAttribute
         """
 
-        return self._parent()
+        # Unparented attributes store none rather than a placeholder function
+        #
+        parent = self._parent
+        return parent() if parent is not None else None
 
     @parent.setter
     def parent(self, parent):
@@ -93,23 +249,24 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         """
 
         # Check for redundancy
+        # Logging arguments are deferred so nothing is formatted unless debugging is enabled
         #
-        if parent is self.parent:
+        oldParent = self.parent
 
-            log.debug(f'{self} is already parented to: {parent}')
+        if parent is oldParent:
+
+            log.debug('%s is already parented to: %s', self, parent)
             return
 
         # Check for none type
         #
-        oldParent = self.parent
-
-        if isinstance(parent, AsciiAttribute):
+        if parent is None:
 
-            self._parent = parent.weakReference()
+            self._parent = None
 
-        elif parent is None:
+        elif isinstance(parent, AsciiAttribute):
 
-            self._parent = self.nullWeakReference
+            self._parent = parent.weakReference()
 
         else:
 
@@ -145,473 +302,11 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         """
         Getter method that returns the children belonging to this object.
 
-        :rtype: weakreflist.WeakRefList
+        :rtype: asciitreemixin.AsciiChildList
         """
 
         return self._children
 
-    def childAdded(self, index, child):
-        """
-        Adds a reference to this object to the supplied child.
-
-        :type index: int
-        :type child: AsciiNode
-        :rtype: None
-        """
-
-        child.parent = self
-
-    def childRemoved(self, child):
-        """
-        Removes the reference of this object from the supplied child.
-
-        :type child: AsciiNode
-        :rtype: None
-        """
-
-        child.parent = None
-
-    @property
-    def longName(self):
-        """
-        Getter method that returns the long name of this attribute.
-
-        :rtype: str
-        """
-
-        return self._parser['-ln']
-
-    @longName.setter
-    def longName(self, longName):
-        """
-        Setter method that updates the long name of this attribute.
-
-        :type longName: str
-        :rtype: None
-        """
-
-        self._parser['-ln'] = longName
-
-    @property
-    def shortName(self):
-        """
-        Getter method that returns the short name of this attribute.
-
-        :rtype: str
-        """
-
-        return self._parser['-sn']
-
-    @shortName.setter
-    def shortName(self, shortName):
-        """
-        Setter method that updates the short name of this attribute.
-
-        :type shortName: str
-        :rtype: None
-        """
-
-        self._parser['-sn'] = shortName
-
-    @property
-    def niceName(self):
-        """
-        Getter method that returns the nice name of this attribute.
-
-        :rtype: str
-        """
-
-        return self._parser.getFlag('-nn', '')
-
-    @niceName.setter
-    def niceName(self, niceName):
-        """
-        Setter method that updates the nice name of this attribute.
-
-        :type niceName: str
-        :rtype: None
-        """
-
-        self._parser['-nn'] = niceName
-
-    @property
-    def attributeType(self):
-        """
-        Getter method that returns the attribute type of this attribute.
-
-        :rtype: str
-        """
-
-        return self._parser.getFlag('-at')
-
-    @attributeType.setter
-    def attributeType(self, attributeType):
-        """
-        Setter method that updates the attribute type of this attribute.
-
-        :type attributeType: str
-        :rtype: None
-        """
-
-        self._parser['-at'] = attributeType
-
-    @property
-    def dataType(self):
-        """
-        Getter method that returns the data type of this attribute.
-
-        :rtype: str
-        """
-
-        return self._parser.getFlag('-dt')
-
-    @dataType.setter
-    def dataType(self, dataType):
-        """
-        Setter method that updates the data type of this attribute.
-
-        :type dataType: str
-        :rtype: None
-        """
-
-        self._parser['-dt'] = dataType
-
-    @property
-    def readable(self):
-        """
-        Getter method that returns the readable flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-r', True)
-
-    @readable.setter
-    def readable(self, readable):
-        """
-        Setter method that updates the readable flag of this attribute.
-
-        :type readable: bool
-        :rtype: None
-        """
-
-        self._parser['-r'] = readable
-
-    @property
-    def writable(self):
-        """
-        Getter method that returns the writable flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-w', True)
-
-    @writable.setter
-    def writable(self, writable):
-        """
-        Setter method that updates the writable flag of this attribute.
-
-        :type writable: bool
-        :rtype: None
-        """
-
-        self._parser['-w'] = writable
-
-    @property
-    def storable(self):
-        """
-        Getter method that returns the storage flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-s', True)
-
-    @storable.setter
-    def storable(self, storable):
-        """
-        Setter method that updates the storable flag of this attribute.
-
-        :type storable: bool
-        :rtype: None
-        """
-
-        self._parser['-s'] = storable
-
-    @property
-    def cachedInternally(self):
-        """
-        Getter method that returns the cached flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-ci', True)
-
-    @cachedInternally.setter
-    def cachedInternally(self, cachedInternally):
-        """
-        Setter method that updates the cached flag of this attribute.
-
-        :type cachedInternally: bool
-        :rtype: None
-        """
-
-        self._parser['-ci'] = cachedInternally
-
-    @property
-    def multi(self):
-        """
-        Getter method that returns the multi flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-m', False)
-
-    @multi.setter
-    def multi(self, multi):
-        """
-        Setter method that updates the multi flag of this attribute.
-
-        :type multi: bool
-        :rtype: None
-        """
-
-        self._parser['-m'] = multi
-
-    @property
-    def indexMatters(self):
-        """
-        Getter method that returns the indexMatters flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-im', True)
-
-    @indexMatters.setter
-    def indexMatters(self, indexMatters):
-        """
-        Setter method that updates the indexMatters flag of this attribute.
-
-        :type indexMatters: bool
-        :rtype: None
-        """
-
-        self._parser['-im'] = indexMatters
-
-    @property
-    def keyable(self):
-        """
-        Getter method that returns the keyable flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-k', False)
-
-    @keyable.setter
-    def keyable(self, keyable):
-        """
-        Setter method that updates the keyable flag of this attribute.
-
-        :type keyable: bool
-        :rtype: None
-        """
-
-        self._parser['-k'] = keyable
-
-    @property
-    def channelBox(self):
-        """
-        Getter method that returns the channelBox flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-cb', False)
-
-    @channelBox.setter
-    def channelBox(self, channelBox):
-        """
-        Setter method that updates the channelBox flag of this attribute.
-
-        :type channelBox: bool
-        :rtype: None
-        """
-
-        self._parser['-cb'] = channelBox
-
-    @property
-    def hidden(self):
-        """
-        Getter method that returns the hidden flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-h', False)
-
-    @hidden.setter
-    def hidden(self, hidden):
-        """
-        Setter method that updates the hidden flag of this attribute.
-
-        :type hidden: bool
-        :rtype: None
-        """
-
-        self._parser['-h'] = hidden
-
-    @property
-    def usedAsFilename(self):
-        """
-        Getter method that returns the usedAsFilename flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-uaf', False)
-
-    @usedAsFilename.setter
-    def usedAsFilename(self, usedAsFilename):
-        """
-        Setter method that updates the usedAsFilename flag of this attribute.
-
-        :type usedAsFilename: bool
-        :rtype: None
-        """
-
-        self._parser['-uaf'] = usedAsFilename
-
-    @property
-    def usedAsColor(self):
-        """
-        Getter method that returns the usedAsColor flag of this attribute.
-
-        :rtype: bool
-        """
-
-        return self._parser.getFlag('-uac', False)
-
-    @usedAsColor.setter
-    def usedAsColor(self, usedAsColor):
-        """
-        Setter method that updates the usedAsColor flag of this attribute.
-
-        :type usedAsColor: bool
-        :rtype: None
-        """
-
-        self._parser['-uac'] = usedAsColor
-
-    @property
-    def minValue(self):
-        """
-        Getter method that returns the minimum value of this attribute.
-
-        :rtype: Union[int, float]
-        """
-
-        return self._parser.getFlag('-min')
-
-    @minValue.setter
-    def minValue(self, minValue):
-        """
-        Setter method that updates the minimum value of this attribute.
-
-        :type: minValue: Union[int, float]
-        :rtype: None
-        """
-
-        self._parser['-min'] = minValue
-
-    @property
-    def maxValue(self):
-        """
-        Getter method that returns the maximum value of this attribute.
-
-        :rtype: Union[int, float]
-        """
-
-        return self._parser.getFlag('-max')
-
-    @maxValue.setter
-    def maxValue(self, maxValue):
-        """
-        Setter method that updates the maximum value of this attribute.
-
-        :type: maxValue: Union[int, float]
-        :rtype: None
-        """
-
-        self._parser['-max'] = maxValue
-
-    @property
-    def softMinValue(self):
-        """
-        Getter method that returns the soft minimum value of this attribute.
-
-        :rtype: Union[int, float]
-        """
-
-        return self._parser.getFlag('-smn')
-
-    @softMinValue.setter
-    def softMinValue(self, softMinValue):
-        """
-        Setter method that updates the soft minimum value of this attribute.
-
-        :type: softMinValue: Union[int, float]
-        :rtype: None
-        """
-
-        self._parser['-smn'] = softMinValue
-
-    @property
-    def softMaxValue(self):
-        """
-        Getter method that returns the soft maximum value of this attribute.
-
-        :rtype: Union[int, float]
-        """
-
-        return self._parser.getFlag('-smx')
-
-    @softMaxValue.setter
-    def softMaxValue(self, softMaxValue):
-        """
-        Setter method that updates the soft maximum value of this attribute.
-
-        :type: softMaxValue: Union[int, float]
-        :rtype: None
-        """
-
-        self._parser['-smx'] = softMaxValue
-
-    @property
-    def defaultValue(self):
-        """
-        Getter method that returns the default value of this attribute.
-
-        :rtype: object
-        """
-
-        return self._parser.getFlag('-dv')
-
-    @defaultValue.setter
-    def defaultValue(self, defaultValue):
-        """
-        Setter method that updates the default value of this attribute.
-
-        :type defaultValue: object
-        :rtype: None
-        """
-
-        self._parser['-dv'] = defaultValue
-
     @property
     def isDynamic(self):
         """
@@ -640,7 +335,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: bool
         """
 
-        return self._parser.hasFlag('-dt')
+        return self._dataType is not None
 
     @property
     def isArray(self):
@@ -660,7 +355,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: bool
         """
 
-        return self.minValue is not None
+        return self._minValue is not None
 
     @property
     def hasMaxValue(self):
@@ -670,7 +365,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: bool
         """
 
-        return self.maxValue is not None
+        return self._maxValue is not None
 
     @property
     def hasSoftMinValue(self):
@@ -680,7 +375,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: bool
         """
 
-        return self.softMinValue is not None
+        return self._softMinValue is not None
 
     @property
     def hasSoftMaxValue(self):
@@ -690,7 +385,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: bool
         """
 
-        return self.softMaxValue is not None
+        return self._softMaxValue is not None
 
     @property
     def isClamped(self):
@@ -700,7 +395,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: bool
         """
 
-        return self.hasMinValue or self.hasMaxValue
+        return self._minValue is not None or self._maxValue is not None
 
     def update(self, items):
         """
@@ -712,21 +407,62 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
 
         # Check for any keyword arguments
         #
+        if len(items) == 0:
+
+            return
+
+        setters = self.getPropertySetters()
+
         for (key, value) in items.items():
 
-            # Check if class has attribute
+            # Check if this is a writable property
             #
-            if not hasattr(self.__class__, key):
+            fset = setters.get(key, None)
 
-                continue
+            if fset is not None:
 
-            # Check if this is a property
-            #
-            func = getattr(self.__class__, key)
+                fset(self, value)
+
+    @classmethod
+    def getPropertySetters(cls):
+        """
+        Returns the property setters belonging to this class.
+        The setters are collected from the method resolution order once and then cached.
+
+        :rtype: dict[str, function]
+        """
+
+        # Check for redundancy
+        #
+        setters = cls.__setters__.get(cls, None)
+
+        if setters is not None:
+
+            return setters
+
+        # Collect setters from base classes
+        # Be sure to do this in reverse so derived classes take priority!
+        #
+        setters = {}
+
+        for base in reversed(cls.__mro__):
+
+            for (name, func) in vars(base).items():
+
+                if isinstance(func, property) and func.fset is not None:
+
+                    setters[name] = func.fset
+
+                elif isinstance(func, AsciiFlagProperty):
+
+                    setters[name] = func.__set__
 
-            if isinstance(func, property):
+                else:
 
-                func.fset(self, value)
+                    continue
+
+        cls.__setters__[cls] = setters
+        return setters
 
     def getDataType(self):
         """
@@ -737,6 +473,34 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
 
         return asciidata.getDataType(self)
 
+    def flush(self):
+        """
+        Copies any modified flag values back onto the parser.
+        Default values are skipped unless the parser already contains the flag.
+
+        :rtype: None
+        """
+
+        # Check if any flags have changed
+        #
+        if not self._dirty:
+
+            return
+
+        # Iterate through flag properties
+        #
+        parser = self._parser
+
+        for descriptor in self.__properties__:
+
+            value = getattr(self, descriptor.slot)
+
+            if value != descriptor.default or parser.hasFlag(descriptor.flag):
+
+                parser[descriptor.flag] = value
+
+        self._dirty = False
+
     def getAddAttrCmd(self):
         """
         Returns the command string used to create this attribute.
@@ -744,6 +508,7 @@ class AsciiAttribute(asciitreemixin.AsciiTreeMixin):
         :rtype: str
         """
 
+        self.flush()
         return self._parser.toString()
 
 
@@ -760,23 +525,28 @@ def listPlugin(typeName):
     nodeClass = om.MNodeClass(typeName)
     numAttributes = nodeClass.attributeCount
 
-    attributes = hashtable.HashTable()
+    lookup = {}  # Plain dictionary avoids the hash table's method dispatch inside the loop
+
+    # Bind any module lookups to locals
+    # This avoids resolving the same globals on every iteration!
+    #
+    getAttribute = nodeClass.attribute
+    MFnAttribute = om.MFnAttribute
+    AsciiArgParser = asciiargparser.AsciiArgParser
 
     for i in range(numAttributes):
 
         # Collect attribute properties from command
         #
-        obj = nodeClass.attribute(i)
-        command = om.MFnAttribute(obj).getAddAttrCmd(False)
+        obj = getAttribute(i)
+        command = MFnAttribute(obj).getAddAttrCmd(False)
 
-        args = asciiargparser.AsciiArgParser(command)
+        args = AsciiArgParser(command)
 
         # Create new attribute
         #
         attribute = AsciiAttribute(args, dynamic=False)
-
-        attributes[attribute.shortName] = attribute
-        attributes[attribute.longName] = attribute
+        lookup[attribute.shortName] = lookup[attribute.longName] = attribute
 
         # Check if attribute has a parent
         #
@@ -784,6 +554,11 @@ def listPlugin(typeName):
 
         if parent is not None:
 
-            attribute.parent = attributes[parent]
+            attribute.parent = lookup[parent]
+
+    # Copy attributes into hash table in bulk
+    #
+    attributes = hashtable.HashTable()
+    attributes.update(lookup)
 
     return attributes
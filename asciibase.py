@@ -1,23 +1,87 @@
 import re
 import weakref
 
+from functools import lru_cache
+
 from abc import ABCMeta, abstractmethod
 from .decorators import classproperty
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+def deadReference():
+    """
+    Returns nothing in place of a referent.
+    This function is shared by every object that requires a null weak reference.
+
+    :rtype: None
+    """
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def stripDagPath(name):
+    """
+    Removes any pipe characters from the supplied name.
+    Results are cached since the same node names are stripped repeatedly during a scene load.
+
+    :type name: str
+    :rtype: str
+    """
+
+    return name.rpartition('|')[2]
+
+
+@lru_cache(maxsize=4096)
+def stripNamespace(name):
+    """
+    Removes any colon characters from the supplied name.
+
+    :type name: str
+    :rtype: str
+    """
+
+    return name.rpartition(':')[2]
+
+
+@lru_cache(maxsize=4096)
+def stripAll(name):
+    """
+    Removes any pipe and colon characters from the supplied name.
+
+    :type name: str
+    :rtype: str
+    """
+
+    return stripNamespace(stripDagPath(name))
+
+
+@lru_cache(maxsize=4096)
+def splitName(name):
+    """
+    Returns the namespace and name from the given string.
+
+    :type name: str
+    :rtype: str, str
+    """
+
+    namespace, delimiter, name = stripDagPath(name).rpartition(':')
+    return namespace, name
+
+
 class AsciiBase(object):
     """
     Abstract base class used for all Ascii objects.
     """
 
-    __slots__ = ('__weakref__',)
+    __slots__ = ('__weakref__', '_weakReference')
     __metaclass__ = ABCMeta
 
+    className = 'AsciiBase'
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance is created.
@@ -27,6 +91,26 @@ class AsciiBase(object):
         #
         super(AsciiBase, self).__init__()
 
+        # Declare private variables
+        #
+        self._weakReference = None
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Private method called whenever a new subclass is created.
+        The class name is stored as a plain class attribute to avoid any descriptor lookups.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(AsciiBase, cls).__init_subclass__(**kwargs)
+
+        # Update class name
+        #
+        cls.className = cls.__name__
+
     def __hash__(self):
         """
         Private method that returns a hashable value for this instance.
@@ -48,24 +132,31 @@ class AsciiBase(object):
     def weakReference(self):
         """
         Returns a weak reference to this object.
+        The reference is created on demand and then reused for every subsequent call.
 
         :rtype: weakref.ref
         """
 
-        return weakref.ref(self)
+        reference = self._weakReference
+
+        if reference is None:
+
+            reference = self._weakReference = weakref.ref(self)
+
+        return reference
 
     @classproperty
     def nullWeakReference(self):
         """
         Getter method that returns a null weak reference.
 
-        :rtype: lambda
+        :rtype: function
         """
 
-        return lambda: None
+        return deadReference
 
-    @classmethod
-    def splitName(cls, name):
+    @staticmethod
+    def splitName(name):
         """
         Returns the namespace and name from the given string.
 
@@ -73,22 +164,7 @@ class AsciiBase(object):
         :rtype: str, str
         """
 
-        # Strip any pipe delimiters
-        #
-        name = cls.stripDagPath(name)
-
-        # Split using namespace delimiter
-        #
-        strings = name.split(':')
-        numStrings = len(strings)
-
-        if numStrings >= 2:
-
-            return ':'.join(strings[:-1]), strings[-1]
-
-        else:
-
-            return '', strings[0]
+        return splitName(name)
 
     @staticmethod
     def stripDagPath(name):
@@ -99,7 +175,7 @@ class AsciiBase(object):
         :rtype: str
         """
 
-        return name.split('|')[-1]
+        return stripDagPath(name)
 
     @staticmethod
     def stripNamespace(name):
@@ -110,10 +186,10 @@ class AsciiBase(object):
         :rtype: str
         """
 
-        return name.split(':')[-1]
+        return stripNamespace(name)
 
-    @classmethod
-    def stripAll(cls, name):
+    @staticmethod
+    def stripAll(name):
         """
         Method used to remove any unwanted characters from the supplied name.
 
@@ -121,7 +197,4 @@ class AsciiBase(object):
         :rtype: str
         """
 
-        name = cls.stripDagPath(name)
-        name = cls.stripNamespace(name)
-
-        return name
+        return stripAll(name)
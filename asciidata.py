@@ -2,22 +2,47 @@ import numpy
 import maya.api.OpenMaya as om
 
 from abc import ABCMeta, abstractmethod
-from collections import deque
-from itertools import islice
+from itertools import chain
 from . import asciibase
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+def joinArray(array):
+    """
+    Returns a space separated string from the supplied array.
+    The array is converted to python scalars in bulk which is much faster than formatting each numpy scalar.
+
+    :type array: Union[numpy.ndarray, list]
+    :rtype: str
+    """
+
+    return ' '.join(map(str, numpy.ravel(array).tolist()))
+
+
+def groupStrings(strings, size, dtype):
+    """
+    Returns a list of converted values grouped together based on the specified chunk size.
+    The strings are converted lazily and zipped together so no intermediate arrays are created.
+
+    :type strings: list[str]
+    :type size: int
+    :type dtype: type
+    :rtype: list[list[Any]]
+    """
+
+    values = map(dtype, strings)
+    return list(map(list, zip(*[values] * size)))
+
+
 class AsciiData(asciibase.AsciiBase):
     """
     Ascii class used to interface with user data.
     """
 
-    __slots__ = ('__attribute__', '__value__')
+    __slots__ = ('__attribute__', '__cache__', '__value__')
     __metaclass__ = ABCMeta
     __default__ = None
 
@@ -36,6 +61,7 @@ class AsciiData(asciibase.AsciiBase):
         # Declare class variables
         #
         self.__attribute__ = attribute.weakReference()
+        self.__cache__ = None
         self.__value__ = self.creator()
 
     def __str__(self):
@@ -45,7 +71,7 @@ class AsciiData(asciibase.AsciiBase):
         :rtype: str
         """
 
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object: {self.__value__}>'
+        return f'<{self.__module__}.{self.className} object: {self.__value__}>'
 
     @classmethod
     @abstractmethod
@@ -77,7 +103,17 @@ class AsciiData(asciibase.AsciiBase):
         :rtype: mason.asciiattribute.AsciiAttribute
         """
 
-        return self.__attribute__()
+        # Check if attribute has been cached
+        # Data blocks never outlive the attribute they were allocated for so a strong reference is safe
+        #
+        attribute = self.__cache__
+
+        if attribute is None:
+
+            attribute = self.__attribute__()
+            self.__cache__ = attribute
+
+        return attribute
 
     @property
     def defaultValue(self):
@@ -88,9 +124,11 @@ class AsciiData(asciibase.AsciiBase):
         :rtype: object
         """
 
-        if self.attribute.defaultValue is not None:
+        defaultValue = self.attribute.defaultValue
+
+        if defaultValue is not None:
 
-            return self.attribute.defaultValue
+            return defaultValue
 
         else:
 
@@ -122,7 +160,22 @@ class AsciiData(asciibase.AsciiBase):
         :rtype: bool
         """
 
-        return self.__value__ == other
+        # Check for identity first
+        # Untouched values still reference their default!
+        #
+        value = self.__value__
+
+        if value is other:
+
+            return True
+
+        elif isinstance(value, numpy.ndarray):
+
+            return numpy.array_equal(value, other)  # Avoids evaluating the truth of an element-wise comparison
+
+        else:
+
+            return value == other
 
     def get(self):
         """
@@ -189,7 +242,7 @@ class AsciiNumber(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return numpy.array(strings, dtype=cls.__dtype__).tolist()
+        return list(map(cls.__dtype__, strings))
 
     @classmethod
     def __writeascii__(cls, value):
@@ -202,11 +255,13 @@ class AsciiBool(AsciiNumber):
     __slots__ = ()
     __dtype__ = bool
     __default__ = False
+    __states__ = frozenset(['on', 'yes', 'true', 'On', 'Yes', 'True', '1'])
 
     @classmethod
     def __readascii__(cls, strings):
 
-        return [x in ('on', 'yes', 'true') for x in strings]
+        states = cls.__states__
+        return [x in states for x in strings]
 
     @classmethod
     def __writeascii__(cls, value):
@@ -229,7 +284,7 @@ class AsciiInt2(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return numpy.array(strings, dtype=int).reshape(-1, 2).tolist()
+        return groupStrings(strings, 2, int)
 
 
 class AsciiInt3(AsciiData):
@@ -240,13 +295,13 @@ class AsciiInt3(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return numpy.array(strings, dtype=int).reshape(-1, 3).tolist()
+        return groupStrings(strings, 3, int)
 
 
 class AsciiFloat(AsciiNumber):
 
     __slots__ = ()
-    __type__ = float
+    __dtype__ = float
     __default__ = 0.0
 
 
@@ -258,7 +313,7 @@ class AsciiFloat2(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return numpy.array(strings, dtype=float).reshape(-1, 2).tolist()
+        return groupStrings(strings, 2, float)
 
 
 class AsciiFloat3(AsciiData):
@@ -269,7 +324,7 @@ class AsciiFloat3(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return numpy.array(strings, dtype=float).reshape(-1, 3).tolist()
+        return groupStrings(strings, 3, float)
 
 
 class AsciiFloat4(AsciiData):
@@ -280,7 +335,7 @@ class AsciiFloat4(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return numpy.array(strings, dtype=float).reshape(-1, 4).tolist()
+        return groupStrings(strings, 4, float)
 
 
 class AsciiString(AsciiData):
@@ -291,7 +346,13 @@ class AsciiString(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return [''.join(strings)]
+        if len(strings) == 1:
+
+            return [strings[0]]  # Most strings consist of a single token
+
+        else:
+
+            return [''.join(strings)]
 
     @classmethod
     def __writeascii__(cls, value):
@@ -303,6 +364,19 @@ class AsciiMatrix(AsciiData):
 
     __slots__ = ()
     __default__ = om.MMatrix.kIdentity
+    __xform__ = (
+        'scale',
+        'rotate',
+        'translate',
+        'shear',
+        'scalePivot',
+        'scalePivotTranslate',
+        'rotatePivot',
+        'rotatePivotTranslate',
+        'rotateOrient',
+        'jointOrient',
+        'inverseParentScale'
+    )  # Float components in serialization order, the rotate order follows the first six floats
 
     @property
     def isTransformation(self):
@@ -327,24 +401,29 @@ class AsciiMatrix(AsciiData):
 
         if numStrings == 16:
 
-            matrix = om.MMatrix(numpy.array(strings, dtype=float))
+            matrix = om.MMatrix(numpy.fromstring(' '.join(strings), dtype=float, sep=' ').tolist())
 
         elif numStrings == 38:
 
+            # Parse all transform components in a single pass
+            # The rotate order and compensate flag are the only non-float tokens!
+            #
+            floats = numpy.fromiter(map(float, chain(strings[1:7], strings[8:37])), dtype=float, count=35)
+
             matrix = {
-                'scale': numpy.array(strings[1:4]).astype(numpy.float),
-                'rotate': numpy.array(strings[4:7]).astype(numpy.float),
+                'scale': floats[0:3],
+                'rotate': floats[3:6],
                 'rotateOrder': int(strings[7]),
-                'translate': numpy.array(strings[8:11]).astype(numpy.float),
-                'shear': numpy.array(strings[11:14]).astype(numpy.float),
-                'scalePivot': numpy.array(strings[14:17]).astype(numpy.float),
-                'scalePivotTranslate': numpy.array(strings[17:20]).astype(numpy.float),
-                'rotatePivot': numpy.array(strings[20:23]).astype(numpy.float),
-                'rotatePivotTranslate': numpy.array(strings[23:26]).astype(numpy.float),
-                'rotateOrient': numpy.array(strings[26:30]).astype(numpy.float),
-                'jointOrient': numpy.array(strings[30:34]).astype(numpy.float),
-                'inverseParentScale': numpy.array(strings[34:37]).astype(numpy.float),
-                'compensateForParentScale': bool(strings[37])
+                'translate': floats[6:9],
+                'shear': floats[9:12],
+                'scalePivot': floats[12:15],
+                'scalePivotTranslate': floats[15:18],
+                'rotatePivot': floats[18:21],
+                'rotatePivotTranslate': floats[21:24],
+                'rotateOrient': floats[24:28],
+                'jointOrient': floats[28:32],
+                'inverseParentScale': floats[32:35],
+                'compensateForParentScale': strings[37] == 'yes'
             }
 
         else:
@@ -358,21 +437,14 @@ class AsciiMatrix(AsciiData):
 
         if isinstance(value, dict):
 
-            return '"xform" {scale} {rotate} {rotateOrder} {translate} {shear} {scalePivot} {scalePivotTranslate} {rotatePivot} {rotatePivotTranslate} {rotateOrient} {jointOrient} {inverseParentScale} {compensateForParentScale}'.format(
-                scale=' '.join(map(str, value['scale'])),
-                rotate=' '.join(map(str, value['rotate'])),
-                rotateOrder=str(value['rotateOrder']),
-                translate=' '.join(map(str, value['translate'])),
-                shear=' '.join(map(str, value['shear'])),
-                scalePivot=' '.join(map(str, value['scalePivot'])),
-                scalePivotTranslate=' '.join(map(str, value['scalePivotTranslate'])),
-                rotatePivot=' '.join(map(str, value['rotatePivot'])),
-                rotatePivotTranslate=' '.join(map(str, value['rotatePivotTranslate'])),
-                rotateOrient=' '.join(map(str, value['rotateOrient'])),
-                jointOrient=' '.join(map(str, value['jointOrient'])),
-                inverseParentScale=' '.join(map(str, value['inverseParentScale'])),
-                compensateForParentScale=str(value['compensateForParentScale'])
-            )
+            # Convert all float components in a single pass
+            # The rotate order is then spliced in after the scale and rotate components!
+            #
+            floats = list(map(str, numpy.concatenate([value[key] for key in cls.__xform__]).tolist()))
+            head, tail = ' '.join(floats[:6]), ' '.join(floats[6:])
+            compensate = 'yes' if value['compensateForParentScale'] else 'no'
+
+            return f'"xform" {head} {value["rotateOrder"]} {tail} {compensate}'
 
         else:
 
@@ -388,13 +460,7 @@ class AsciiIntArray(AsciiData):
     def __readascii__(cls, strings):
 
         sizeHint = int(strings[0])
-        array = om.MIntArray(sizeHint, 0)
-
-        for i in range(sizeHint):
-
-            array[i] = int(strings[i + 1])
-
-        return [array]
+        return [om.MIntArray(list(map(int, strings[1:sizeHint + 1])))]
 
     @classmethod
     def __writeascii__(cls, value):
@@ -414,13 +480,7 @@ class AsciiDoubleArray(AsciiData):
     def __readascii__(cls, strings):
 
         sizeHint = int(strings[0])
-        array = om.MDoubleArray(sizeHint, 0.0)
-
-        for i in range(sizeHint):
-
-            array[i] = float(strings[i + 1])
-
-        return [array]
+        return [om.MDoubleArray(list(map(float, strings[1:sizeHint + 1])))]
 
     @classmethod
     def __writeascii__(cls, value):
@@ -440,24 +500,15 @@ class AsciiPointArray(AsciiData):
     def __readascii__(cls, strings):
 
         sizeHint = int(strings[0])
-        array = om.MPointArray(sizeHint, om.MPoint.kOrigin)
-
-        for (physicalIndex, logicalIndex) in enumerate(range(0, sizeHint * 4, 4)):
-
-            array[physicalIndex] = om.MPoint(
-                float(strings[logicalIndex + 1]),
-                float(strings[logicalIndex + 2]),
-                float(strings[logicalIndex + 3]),
-                float(strings[logicalIndex + 4])
-            )
+        points = groupStrings(strings[1:(sizeHint * 4) + 1], 4, float)
 
-        return [array]
+        return [om.MPointArray([om.MPoint(*point) for point in points])]
 
     @classmethod
     def __writeascii__(cls, value):
 
         numPoints = len(value)
-        points = ' '.join([f'{x.x} {x.y} {x.z} {x.w}' for x in value])
+        points = ' '.join(map(str, chain.from_iterable(value)))
 
         return f'{numPoints} {points}'
 
@@ -471,23 +522,15 @@ class AsciiVectorArray(AsciiData):
     def __readascii__(cls, strings):
 
         sizeHint = int(strings[0])
-        array = om.MVectorArray(sizeHint, om.MVector.kZeroVector)
+        vectors = groupStrings(strings[1:(sizeHint * 3) + 1], 3, float)
 
-        for (physicalIndex, logicalIndex) in enumerate(range(0, sizeHint * 3, 3)):
-
-            array[physicalIndex] = om.MVector(
-                float(strings[logicalIndex + 1]),
-                float(strings[logicalIndex + 2]),
-                float(strings[logicalIndex + 3])
-            )
-
-        return [array]
+        return [om.MVectorArray([om.MVector(*vector) for vector in vectors])]
 
     @classmethod
     def __writeascii__(cls, value):
 
         numVectors = len(value)
-        vectors = ' '.join([f'{x.x} {x.y} {x.z}' for x in value])
+        vectors = ' '.join(map(str, chain.from_iterable(value)))
 
         return f'{numVectors} {vectors}'
 
@@ -549,12 +592,14 @@ class AsciiAttributeAlias(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        return [{strings[i]: strings[i+1] for i in range(0, len(strings), 2)}]
+        iterator = iter(strings)
+        return [dict(zip(iterator, iterator))]  # Consumes the strings in key/value pairs
 
     @classmethod
     def __writeascii__(cls, value):
 
-        return '{{{aliases}}}'.format(aliases=', '.join([f'"{key}", "{value}"' for (key, value) in value.items()]))
+        aliases = ', '.join([f'"{key}", "{value}"' for (key, value) in value.items()])
+        return f'{{{aliases}}}'
 
 
 class AsciiComponentList(AsciiData):
@@ -598,26 +643,21 @@ class AsciiNurbsCurve(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        iterator = iter(strings)
-        degree = int(next(iterator))
-        spans = int(next(iterator))
-        form = int(next(iterator))
-        isRational = bool(next(iterator))
-        dimension = int(next(iterator))
-
-        knotCount = int(next(iterator))
-        knots = [int(x) for x in islice(iterator, knotCount)]
+        degree = int(strings[0])
+        spans = int(strings[1])
+        form = int(strings[2])
+        isRational = strings[3] == 'yes'
+        dimension = int(strings[4])
 
-        cvCount = int(next(iterator))
-        cvs = None
+        knotCount = int(strings[5])
+        knots = numpy.fromstring(' '.join(strings[6:6 + knotCount]), dtype=float, sep=' ')
+        position = 6 + knotCount
 
-        if isRational:
+        cvCount = int(strings[position])
+        stride = 4 if isRational else 3
+        position += 1
 
-            cvs = numpy.array(tuple(islice(iterator, cvCount * 4))).reshape([cvCount, 4])
-
-        else:
-
-            cvs = numpy.array(tuple(islice(iterator, cvCount * 3))).reshape([cvCount, 3])
+        cvs = numpy.fromstring(' '.join(strings[position:position + (cvCount * stride)]), dtype=float, sep=' ').reshape((cvCount, stride))
 
         nurbsCurve = {
             'degree': degree,
@@ -640,12 +680,12 @@ class AsciiNurbsCurve(AsciiData):
             degree=value['degree'],
             spans=value['spans'],
             form=value['form'],
-            isRational=value['isRational'],
+            isRational='yes' if value['isRational'] else 'no',
             dimension=value['dimension'],
             knotCount=value['knotCount'],
-            knots=' '.join(map(str, value['knots'].flatten())),
+            knots=joinArray(value['knots']),
             cvCount=value['cvCount'],
-            cvs=' '.join(map(str, value['cvs'].flatten())),
+            cvs=joinArray(value['cvs']),
         )
 
 
@@ -657,27 +697,26 @@ class AsciiNurbsSurface(AsciiData):
     @classmethod
     def __readascii__(cls, strings):
 
-        iterator = iter(strings)
-        uDegree = int(next(iterator))
-        vDegree = int(next(iterator))
-        uForm = int(next(iterator))
-        vForm = int(next(iterator))
-        isRational = bool(next(iterator))
-        uKnotCount = int(next(iterator))
-        uKnots = [float(x) for x in islice(iterator, uKnotCount)]
-        vKnotCount = int(next(iterator))
-        vKnots = [float(x) for x in islice(iterator, vKnotCount)]
-        trim = next(iterator)
-        cvCount = int(next(iterator))
-        cvs = None
-
-        if isRational:
-
-            cvs = numpy.array(tuple(islice(iterator, cvCount * 4))).reshape([cvCount, 4])
+        uDegree = int(strings[0])
+        vDegree = int(strings[1])
+        uForm = int(strings[2])
+        vForm = int(strings[3])
+        isRational = strings[4] == 'yes'
 
-        else:
+        uKnotCount = int(strings[5])
+        uKnots = numpy.fromstring(' '.join(strings[6:6 + uKnotCount]), dtype=float, sep=' ').tolist()
+        position = 6 + uKnotCount
+
+        vKnotCount = int(strings[position])
+        vKnots = numpy.fromstring(' '.join(strings[position + 1:position + 1 + vKnotCount]), dtype=float, sep=' ').tolist()
+        position += 1 + vKnotCount
 
-            cvs = numpy.array(tuple(islice(iterator, cvCount * 3))).reshape([cvCount, 3])
+        trim = strings[position]
+        cvCount = int(strings[position + 1])
+        stride = 4 if isRational else 3
+        position += 2
+
+        cvs = numpy.fromstring(' '.join(strings[position:position + (cvCount * stride)]), dtype=float, sep=' ').reshape((cvCount, stride))
 
         nurbsSurface = {
             'uDegree': uDegree,
@@ -699,19 +738,19 @@ class AsciiNurbsSurface(AsciiData):
     @classmethod
     def __writeascii__(cls, value):
 
-        return '{uDegree} {vDegree} {uForm} {vForm} {spans} {form} {isRational} {dimension} {knotCount} {knots} {cvCount} {cvs}'.format(
+        return '{uDegree} {vDegree} {uForm} {vForm} {isRational} {uKnotCount} {uKnots} {vKnotCount} {vKnots} {trim} {cvCount} {cvs}'.format(
             uDegree=value['uDegree'],
             vDegree=value['vDegree'],
             uForm=value['uForm'],
             vForm=value['vForm'],
-            spans=value['spans'],
-            form=value['form'],
-            isRational=value['isRational'],
-            dimension=value['dimension'],
-            knotCount=value['knotCount'],
-            knots=' '.join(map(str, value['knots'].flatten())),
+            isRational='yes' if value['isRational'] else 'no',
+            uKnotCount=value['uKnotCount'],
+            uKnots=joinArray(value['uKnots']),
+            vKnotCount=value['vKnotCount'],
+            vKnots=joinArray(value['vKnots']),
+            trim=value['trim'],
             cvCount=value['cvCount'],
-            cvs=' '.join(map(str, value['cvs'].flatten())),
+            cvs=joinArray(value['cvs']),
         )
 
 
@@ -720,43 +759,43 @@ class AsciiMesh(AsciiData):
     __slots__ = ()
 
     __meshtypes__ = {
-        'v': lambda x: numpy.array(tuple(islice(x, int(next(x)) * 3)), dtype=int).reshape((-1, 3)),
-        'vn': lambda x: numpy.array(tuple(islice(x, int(next(x)) * 3)), dtype=int).reshape((-1, 3)),
-        'vt': lambda x: numpy.array(tuple(islice(x, int(next(x)) * 2)), dtype=int).reshape((-1, 2)),
-        'e': lambda x: numpy.array(tuple(islice(x, int(next(x)) * 3)), dtype=int).reshape((-1, 3)),
+        'v': (float, 3),
+        'vn': (float, 3),
+        'vt': (float, 2),
+        'e': (numpy.int32, 3),
     }
 
     @classmethod
     def __readascii__(cls, strings):
 
-        iterator = iter(strings)
-        meshes = deque()
+        meshes = []
         mesh = None
 
-        while True:
-
-            try:
+        position = 0
+        numStrings = len(strings)
 
-                key = next(iterator)
+        while position < numStrings:
 
-                if key == 'v':
+            key = strings[position]
 
-                    mesh = {'v': None, 'vn': None, 'vt': None, 'e': None}
-                    meshes.append(mesh)
+            if key == 'v':
 
-                func = cls.__meshtypes__[key]
-                mesh[key] = func(iterator)
+                mesh = {'v': None, 'vn': None, 'vt': None, 'e': None}
+                meshes.append(mesh)
 
-            except StopIteration:
+            dtype, stride = cls.__meshtypes__[key]
+            count = int(strings[position + 1]) * stride
+            position += 2
 
-                break
+            mesh[key] = numpy.fromstring(' '.join(strings[position:position + count]), dtype=dtype, sep=' ').reshape((-1, stride))
+            position += count
 
         return meshes
 
     @classmethod
     def __writeascii__(cls, value):
 
-        return ' '.join([f'{key} {len(item)} {" ".join(map(str, item.flatten()))}' for (key, item) in value.items() if item is not None])
+        return ' '.join([f'{key} {len(item)} {joinArray(item)}' for (key, item) in value.items() if item is not None])
 
 
 class AsciiPolyFaces(AsciiData):
@@ -766,44 +805,58 @@ class AsciiPolyFaces(AsciiData):
 
     __slots__ = ()
 
+    # Each keyword maps to the number of tokens preceding its count and a handler that stores its indices
+    # Faces are always started by the "f" keyword which the remaining keywords then append onto!
+    #
     __polyfacetypes__ = {
-        'f': lambda x: numpy.array(tuple(islice(x, int(next(x)))), dtype=int),
-        'h': lambda x: numpy.array(tuple(islice(x, int(next(x)))), dtype=int),
-        'mu': lambda x: numpy.array(tuple(islice(x, int(next(x)))), dtype=int),
-        'mc': lambda x: numpy.array(tuple(islice(x, int(next(x)))), dtype=int),
+        'f': (0, lambda polyFaces, indices: polyFaces.append({'f': indices, 'h': None, 'mu': [], 'mc': []})),
+        'h': (0, lambda polyFaces, indices: polyFaces[-1].__setitem__('h', indices)),
+        'mu': (1, lambda polyFaces, indices: polyFaces[-1]['mu'].append(indices)),
+        'mc': (1, lambda polyFaces, indices: polyFaces[-1]['mc'].append(indices)),
     }
 
     @classmethod
     def __readascii__(cls, strings, **kwargs):
 
-        iterator = iter(strings)
-        polyFaces = deque()
-        polyFace = None
+        # Locate all records up front
+        # Only the keywords and counts are visited here, the indices are skipped over!
+        #
+        records = []
 
-        while True:
+        position = 0
+        numStrings = len(strings)
+
+        while position < numStrings:
 
-            try:
+            key = strings[position]
+            polyFaceType = cls.__polyfacetypes__.get(key, None)
 
-                key = next(iterator)
-                func = cls.__polyfacetypes__[key]
+            if polyFaceType is None:
 
-                if key == 'f':
+                raise ValueError(f'Invalid poly face keyword supplied: {key}')
 
-                    polyFace = {'f': None, 'h': None, 'mu': [], 'mc': []}
-                    polyFaces.append(polyFace)
+            skip, handler = polyFaceType  # Set indices are skipped over
 
-                if key in ('mu', 'mc'):
+            count = int(strings[position + skip + 1])
+            start = position + skip + 2
+            position = start + count
 
-                    index = next(iterator)
-                    polyFace[key].append(func(iterator))
+            records.append((handler, start, position))
 
-                else:
+        # Convert all indices in a single pass
+        # Each record is then assigned a view into the shared array
+        #
+        indices = numpy.fromstring(' '.join(chain.from_iterable(strings[start:end] for (handler, start, end) in records)), dtype=numpy.int32, sep=' ')
 
-                    polyFace[key] = func(iterator)
+        polyFaces = []
+        offset = 0
 
-            except StopIteration:
+        for (handler, start, end) in records:
 
-                break
+            count = end - start
+            handler(polyFaces, indices[offset:offset + count])
+
+            offset += count
 
         return polyFaces
 
@@ -811,21 +864,21 @@ class AsciiPolyFaces(AsciiData):
     def __writeascii__(cls, value):
 
         faceVertexIndices = value['f']
-        string = 'f {count} {indices}'.format(count=len(faceVertexIndices), indices=' '.join(map(str, faceVertexIndices)))
+        string = 'f {count} {indices}'.format(count=len(faceVertexIndices), indices=joinArray(faceVertexIndices))
 
         holes = value['h']
 
         if holes is not None:
 
-            string += ' h {count} {indices}'.format(count=len(holes), indices=' '.join(map(str, holes)))
+            string += ' h {count} {indices}'.format(count=len(holes), indices=joinArray(holes))
 
         for (index, uvSet) in enumerate(value['mu']):
 
-            string += ' mu {index} {count} {indices}'.format(index=index, count=len(uvSet), indices=' '.join(map(str, uvSet)))
+            string += ' mu {index} {count} {indices}'.format(index=index, count=len(uvSet), indices=joinArray(uvSet))
 
         for (index, colorSet) in enumerate(value['mc']):
 
-            string += ' mc {index} {count} {indices}'.format(index=index, count=len(colorSet), indices=' '.join(map(str, colorSet)))
+            string += ' mc {index} {count} {indices}'.format(index=index, count=len(colorSet), indices=joinArray(colorSet))
 
         return string
 
@@ -841,7 +894,7 @@ class AsciiLattice(AsciiData):
             'sDivisionCount': int(strings[0]),
             'tDivisionCount': int(strings[1]),
             'uDivisionCount': int(strings[2]),
-            'points': numpy.array(strings[4:]).astype(numpy.float).reshape(1, 3)
+            'points': numpy.fromstring(' '.join(strings[4:4 + (int(strings[3]) * 3)]), dtype=float, sep=' ').reshape(-1, 3)
         }
 
     @classmethod
@@ -852,7 +905,7 @@ class AsciiLattice(AsciiData):
             tDivisionCount=value['tDivisionCount'],
             uDivisionCount=value['uDivisionCount'],
             pointCount=len(value['points']),
-            points=' '.join(map(str, value['points'].flatten())),
+            points=joinArray(value['points']),
         )
 
 
@@ -905,6 +958,24 @@ __datatypes__ = {
 }
 
 
+def getTypeName(attribute):
+    """
+    Returns the type name associated with the given attribute.
+    Untyped attributes fallback on their attribute type instead.
+
+    :type attribute: asciiattribute.AsciiAttribute
+    :rtype: str
+    """
+
+    typeName = attribute.dataType
+
+    if typeName is None:
+
+        typeName = attribute.attributeType
+
+    return typeName
+
+
 def getDataType(attribute):
     """
     Returns the data type associated with the given attribute.
@@ -913,13 +984,36 @@ def getDataType(attribute):
     :rtype: type
     """
 
-    # Check if this is a typed attribute
+    return __datatypes__.get(getTypeName(attribute), AsciiGeneric)
+
+
+__readers__ = {name: dataType.__readascii__ for (name, dataType) in __datatypes__.items() if dataType is not None}  # Pre-bound to skip the class lookups
+
+
+def readAscii(attribute, strings):
+    """
+    Returns the python equivalent of the supplied ascii strings for the given attribute.
+    The reader is resolved straight from the type name which avoids looking up the data type first.
+
+    :type attribute: asciiattribute.AsciiAttribute
+    :type strings: list[str]
+    :rtype: list[Any]
+    """
+
+    # Check if there is a reader for this type
+    # Unimplemented data types are registered as None and must not fallback on the generic reader!
     #
-    if attribute.isTyped:
+    typeName = getTypeName(attribute)
+    reader = __readers__.get(typeName, None)
 
-        return __datatypes__.get(attribute.dataType, AsciiGeneric)
+    if reader is not None:
 
-    else:
+        return reader(strings)
+
+    elif typeName in __datatypes__:
 
-        return __datatypes__.get(attribute.attributeType, AsciiGeneric)
+        raise TypeError(f'readAscii() does not support {typeName} data!')
+
+    else:
 
+        return AsciiGeneric.__readascii__(strings)
@@ -1,8 +1,12 @@
+import os
+import re
+import mmap
+import locale
+
 from . import asciiscene, asciiargparser, asciiattribute, asciiplug, asciidata
 from .decorators import timer
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -12,10 +16,25 @@ class AsciiFileParser(object):
     Ascii file parser designed to pass command lines into a tree builder.
     """
 
-    __slots__ = ('filePath', 'scene')
+    __slots__ = ('filePath', 'scene', '_delegates')
     __comment__ = '//'
     __delimiter__ = ';'
     __escapechars__ = ''.join([chr(char) for char in range(1, 32)])
+    __commands__ = (
+        'file',
+        'requires',
+        'fileInfo',
+        'currentUnit',
+        'createNode',
+        'select',
+        'rename',
+        'lockNode',
+        'addAttr',
+        'setAttr',
+        'connectAttr',
+        'relationship'
+    )
+    __terminator__ = re.compile(rb';[\x01-\x1f]*?(?:\r\n|\r|\n|$)')  # Accepts the same line endings as universal newlines
 
     def __init__(self, filePath):
         """
@@ -34,6 +53,12 @@ class AsciiFileParser(object):
         self.filePath = filePath
         self.scene = asciiscene.AsciiScene(self.filePath)
 
+        # Declare private variables
+        # Unbound functions are stored to avoid a reference cycle between the parser and its bound methods!
+        #
+        cls = type(self)
+        self._delegates = {name: getattr(cls, name) for name in self.__commands__}
+
         # Parse file
         #
         try:
@@ -52,56 +77,82 @@ class AsciiFileParser(object):
         :rtype: None
         """
 
-        # Open ascii file in memory
+        # Check if ascii file is empty
+        # Empty files cannot be mapped into memory!
         #
-        with open(self.filePath, 'r') as asciiFile:
+        with open(self.filePath, 'rb') as asciiFile:
+
+            if os.fstat(asciiFile.fileno()).st_size == 0:
+
+                log.info('%s[EOF]' % self.filePath)
+                return
 
-            # Iterate through lines in file
+            # Map ascii file into memory
+            # This lets the OS page in the file on demand rather than copying it into a buffer!
+            # Commands are decoded using the same encoding that AsciiScene.saveAs writes with
             #
-            line = ''
-            buffer = ''
+            asciiMap = mmap.mmap(asciiFile.fileno(), 0, access=mmap.ACCESS_READ)
+            encoding = locale.getpreferredencoding(False)
+
+        with asciiMap:
+
+            # Iterate through commands in file
+            # Commands are only terminated by delimiters at the end of a line which are consumed by the search!
+            #
+            start = 0
             lineNumber = 0
 
-            while True:
+            for match in self.__terminator__.finditer(asciiMap):
 
-                # Check for empty string
+                # Decode command from memory map
+                # Any carriage returns are normalized the same way universal newlines would!
                 #
-                line = asciiFile.readline().strip(self.__escapechars__)
-                numChars = len(line)
+                command = asciiMap[start:match.start()].decode(encoding)
+                start = match.end()
 
-                if numChars == 0:
+                if '\r' in command:
 
-                    break
+                    command = command.replace('\r\n', '\n').replace('\r', '\n')
 
-                # Check if this is a comment
+                # Skip any comments preceding the command
                 #
-                if line.startswith(self.__comment__):
+                lineNumber += command.count('\n') + 1
+                command = command.lstrip(self.__escapechars__)
+
+                while command.startswith(self.__comment__):
+
+                    command = command.partition('\n')[2].lstrip(self.__escapechars__)
+
+                # Check for empty string
+                #
+                if len(command) == 0:
 
-                    lineNumber += 1
                     continue
 
-                # Concatenate command line
+                # Concatenate command lines
+                # Escape characters are only stripped from the edges of each line
+                # Any inside of a line, such as tabs in string values, are left untouched!
                 #
-                buffer = line
+                if '\n' in command:
 
-                while not buffer.endswith(self.__delimiter__):
+                    buffer = ' '.join([line.strip(self.__escapechars__) for line in command.split('\n')]) + self.__delimiter__
 
-                    line = asciiFile.readline().strip(self.__escapechars__)
+                else:
 
-                    buffer += f' {line}'
-                    lineNumber += 1
+                    buffer = command + self.__delimiter__
 
                 # Call command delegate
                 #
                 parser = asciiargparser.AsciiArgParser(buffer)
-                func = getattr(self.__class__, parser.name)
+                func = self._delegates.get(parser.name, None)
 
-                log.info(f'Line[{lineNumber}]: {buffer}')
-                func(self, parser)
+                if func is None:
 
-                # Increment line number
-                #
-                lineNumber += 1
+                    log.warning('Line[%s]: Skipping unsupported command: %s', lineNumber, parser.name)
+                    continue
+
+                log.info('Line[%s]: %s', lineNumber, buffer)
+                func(self, parser)
 
         # Notify user
         #
@@ -156,7 +207,7 @@ class AsciiFileParser(object):
         key = parser[0]
         value = parser[1]
 
-        log.info(f'File Info: {key} = {value}')
+        log.info('File Info: %s = %s', key, value)
         self.scene.fileInfo[key] = value
 
     def currentUnit(self, parser):
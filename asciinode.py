@@ -1,10 +1,9 @@
 import maya.api.OpenMaya as om
 
 from . import asciitreemixin, asciiattribute, asciiplug
-from .collections import hashtable, weakreflist, notifylist
+from .collections import hashtable
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -53,18 +52,13 @@ class AsciiNode(asciitreemixin.AsciiTreeMixin):
         self._uuid = ''
         self._type = typeName
         self._parent = self.nullWeakReference
-        self._children = notifylist.NotifyList(cls=weakreflist.WeakRefList)
+        self._children = asciitreemixin.AsciiChildList(self)
         self._locked = False
         self._attributes = hashtable.HashTable()  # Used for dynamic attributes
         self._plugs = hashtable.HashTable()
         self._connections = []
         self._default = kwargs.get('default', False)
 
-        # Setup child notifies
-        #
-        self._children.addCallback('itemAdded', self.childAdded)
-        self._children.addCallback('itemRemoved', self.childRemoved)
-
         # Declare public variables
         #
         self.parent = kwargs.get('parent', None)
@@ -83,7 +77,7 @@ class AsciiNode(asciitreemixin.AsciiTreeMixin):
         :rtype: str
         """
 
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object: {self.absoluteName()}>'
+        return f'<{self.__module__}.{self.className} object: {self.absoluteName()}>'
 
     def __getitem__(self, key):
         """
@@ -281,7 +275,7 @@ class AsciiNode(asciitreemixin.AsciiTreeMixin):
         #
         if parent is self.parent:
 
-            log.debug(f'{self} is already parented to: {parent}')
+            log.debug('%s is already parented to: %s', self, parent)
             return
 
         # Check for none type
@@ -334,34 +328,11 @@ class AsciiNode(asciitreemixin.AsciiTreeMixin):
         """
         Getter method that returns the children belonging to this object.
 
-        :rtype: weakreflist.WeakRefList
+        :rtype: asciitreemixin.AsciiChildList
         """
 
         return self._children
 
-    def childAdded(self, index, child):
-        """
-        Adds a reference to this object to the supplied child.
-
-        :type index: int
-        :type child: AsciiNode
-        :rtype: None
-        """
-
-        if child.parent is not self:
-
-            child.parent = self
-
-    def childRemoved(self, child):
-        """
-        Removes the reference of this object from the supplied child.
-
-        :type child: AsciiNode
-        :rtype: None
-        """
-
-        child.parent = None
-
     @property
     def type(self):
         """
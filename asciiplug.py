@@ -8,7 +8,6 @@ from . import asciitreemixin, asciiattribute, asciidata
 from .collections import sparsearray
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -90,7 +89,7 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
         :rtype: str
         """
 
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object: {self.name}>'
+        return f'<{self.__module__}.{self.className} object: {self.name}>'
 
     def __getitem__(self, key):
         """
@@ -187,34 +186,16 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
 
         if useFullAttributePath:
 
-            # Evaluate plug path
+            # Walk home from this plug
+            # Any array plugs along the way are skipped to avoid redundancies in child elements
             #
-            plugs = list(self.trace())
-            numPlugs = len(plugs)
+            names = [
+                plug.partialName(includeIndices=includeIndices, useLongNames=useLongNames)
+                for plug in self.home()
+                if plug is self or not (plug.isArray and not plug.isElement)
+            ]
 
-            if numPlugs == 1:
-
-                return self.partialName(includeNodeName=includeNodeName, useLongNames=useLongNames)
-
-            # Iterate through path
-            #
-            lastIndex = len(plugs) - 1
-
-            for (i, plug) in enumerate(plugs):
-
-                # Check if this is an array plug
-                # We want to skip this to avoid any redundancies in child elements
-                #
-                if (plug.isArray and not plug.isElement) and i != lastIndex:
-
-                    continue
-
-                # Evaluate next portion of string
-                #
-                delimiter = '.' if len(name) > 0 else ''
-                partialName = plug.partialName(includeIndices=includeIndices, useLongNames=useLongNames)
-
-                name += f'{delimiter}{partialName}'
+            name = '.'.join(reversed(names))
 
         else:
 
@@ -490,14 +471,15 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
         """
 
         # Evaluate plug type
+        # Generators are used so the search stops at the first non-default child!
         #
         if self.isArray and not self.isElement:
 
-            return any([x.isNonDefault for x in self._elements.values()])
+            return any(x.isNonDefault for x in self._elements.values())
 
         elif self.isCompound:
 
-            return any([x.isNonDefault for x in self._children])
+            return any(x.isNonDefault for x in self._children)
 
         else:
 
@@ -527,11 +509,15 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
         #
         if self.isArray and not self.isElement:
 
+            # Resolve the element arguments up front
+            # Size hints usually precede dense arrays so these would otherwise be resolved for every element!
+            #
             current = self.numElements
+            node, attribute, parent = self.node, self.attribute, self.weakReference()
 
             for index in range(current, size, 1):
 
-                self._elements[index] = AsciiPlug(self.node, self.attribute, index=index, parent=self.weakReference())
+                self._elements[index] = AsciiPlug(node, attribute, index=index, parent=parent)
 
         elif self.isElement:
 
@@ -685,8 +671,11 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
         """
 
         # Evaluate plug type
+        # The attribute is only dereferenced once since the array and compound checks both rely on it!
         #
-        if self.isArray and not self.isElement:
+        attribute = self.attribute
+
+        if attribute.isArray and self._index is None:
 
             # Check if elements are sequential
             #
@@ -698,11 +687,11 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
 
                 return {x: y.getValue for (x, y) in self._elements.items()}
 
-        elif self.isCompound:
+        elif attribute.isCompound:
 
             # Check if this is a non-numeric compound attribute
             #
-            if self.attribute.attributeType == 'compound':
+            if attribute.attributeType == 'compound':
 
                 return {x.attribute.longName: x.getValue() for x in self._children}
 
@@ -725,30 +714,42 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
         """
 
         # Evaluate plug type
+        # The attribute is only dereferenced once since the array and compound checks both rely on it!
         #
-        if self.isArray and not self.isElement:
+        attribute = self.attribute
+
+        if attribute.isArray and self._index is None:
 
             # Check value type
             #
             if isinstance(value, (list, tuple)):
 
-                for (index, item) in enumerate(value):
-
-                    element = self.elementByLogicalIndex(index)
-                    element.setValue(item)
+                items = enumerate(value)
 
             elif isinstance(value, dict):
 
-                for (index, item) in value.items():
-
-                    element = self.elementByLogicalIndex(index)
-                    element.setValue(item)
+                items = value.items()
 
             else:
 
                 raise TypeError('setValue() expects a list of values for array plugs!')
 
-        elif self.isCompound:
+            # Assign items to elements
+            # This plug has already been verified as an array so existing elements can be accessed directly!
+            #
+            elements = self._elements
+
+            for (index, item) in items:
+
+                element = elements.get(index, None)
+
+                if element is None:
+
+                    element = self.elementByLogicalIndex(index)
+
+                element.setValue(item)
+
+        elif attribute.isCompound:
 
             # Check if there are enough items
             #
@@ -767,9 +768,13 @@ class AsciiPlug(asciitreemixin.AsciiTreeMixin):
         else:
 
             # Assign value to data block
+            # Resolving the plug name retraces the entire plug path so only do so when debugging!
             #
             self._dataBlock.set(value)
-            log.debug(f'{self.name} = {self._dataBlock}')
+
+            if log.isEnabledFor(logging.DEBUG):
+
+                log.debug('%s = %s', self.name, self._dataBlock)
 
     def getSetAttrCmds(self, nonDefault=True):
         """
@@ -888,7 +893,7 @@ class AsciiPlugPath(object):
     Who knows there may be more???
     """
 
-    __slots__ = ('_scene', '_node', '_segments', '_cache')
+    __slots__ = ('_scene', '_node', '_segments', '_type', '_cache')
     __syntax__ = re.compile(r'([a-zA-Z0-9_]+)(?:\[{1}([:0-9]*)\]{1})?')
 
     def __init__(self, path, scene=None):
@@ -909,6 +914,7 @@ class AsciiPlugPath(object):
         self._scene = scene.weakReference()
         self._node = AsciiPlug.nullWeakReference
         self._segments = None
+        self._type = None
         self._cache = None
 
         # Check if this is a valid string
@@ -937,15 +943,12 @@ class AsciiPlugPath(object):
         groups = self.__syntax__.findall('.'.join(strings))
         indices = {name: self.expandIndex(index) for (name, index) in groups}
 
-        attributes = list(self.node.attribute(groups[-1][0]).trace())
-        numAttributes = len(attributes)
-
-        self._segments = [None] * numAttributes
-
-        for (i, attribute) in enumerate(attributes):
-
-            index = indices.get(attribute.shortName, indices.get(attribute.longName))
-            self._segments[i] = AsciiPlugSegment(attribute=attribute.weakReference(), index=index)
+        # Paths only live for the duration of a command so there is no need for a weak reference here!
+        #
+        self._segments = [
+            AsciiPlugSegment(attribute=attribute, index=indices.get(attribute.shortName, indices.get(attribute.longName)))
+            for attribute in self.node.attribute(groups[-1][0]).trace()
+        ]
 
     def __str__(self):
         """
@@ -1007,26 +1010,37 @@ class AsciiPlugPath(object):
     def type(self):
         """
         Evaluates the path type.
+        The segments never change so the result is cached after the first call.
 
         :rtype: AsciiPlugType
         """
 
+        # Redundancy check
+        #
+        if self._type is not None:
+
+            return self._type
+
+        # Inspect path segments
+        #
         if self.isSingle():
 
-            return AsciiPlugType.kSingle
+            self._type = AsciiPlugType.kSingle
 
         elif self.isArray():
 
-            return AsciiPlugType.kArray
+            self._type = AsciiPlugType.kArray
 
         elif self.isCompoundArray():
 
-            return AsciiPlugType.kCompoundArray
+            self._type = AsciiPlugType.kCompoundArray
 
         else:
 
             raise RuntimeError('type() encountered an unknown path type!')
 
+        return self._type
+
     def isSingle(self):
         """
         Evaluates whether this path represents a single plug.
@@ -1120,7 +1134,7 @@ class AsciiPlugPath(object):
             # Evaluate path segment
             #
             index = segment.index
-            attribute = segment.attribute()
+            attribute = segment.attribute
 
             if i == 0:
 
@@ -1196,7 +1210,7 @@ class AsciiPlugPath(object):
             # Append name
             #
             delimiter = '.' if i > 0 else ''
-            attribute = segment.attribute()
+            attribute = segment.attribute
 
             if useLongNames:
 
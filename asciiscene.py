@@ -3,12 +3,12 @@ import os
 from maya import cmds as mc
 from maya.api import OpenMaya as om
 from datetime import datetime
+from itertools import chain, repeat
 from collections import deque, namedtuple, defaultdict
 
 from . import asciibase, asciiargparser, asciinode
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -288,7 +288,7 @@ class AsciiScene(asciibase.AsciiBase):
         :rtype: str
         """
 
-        return f'<{self.__class__.__module__}.{self.__class__.__name__} object: {self.filePath}>'
+        return f'<{self.__module__}.{self.className} object: {self.filePath}>'
 
     def __dumps__(self):
         """
@@ -577,7 +577,7 @@ class AsciiScene(asciibase.AsciiBase):
         # Create new node
         #
         namespace, name = self.splitName(name)
-        log.info(f'Creating node: {namespace}:{name}')
+        log.info('Creating node: %s:%s', namespace, name)
 
         node = asciinode.AsciiNode(
             typeName,
@@ -697,11 +697,12 @@ class AsciiScene(asciibase.AsciiBase):
 
         log.info(f'Saving ASCII file to: {filePath}')
 
+        # Write lines straight into the file buffer
+        # This avoids concatenating a new string for every line!
+        #
         with open(filePath, 'w') as asciiFile:
 
-            for line in self.__dumps__():
-
-                asciiFile.write(f'{line}\r')
+            asciiFile.writelines(chain.from_iterable(zip(self.__dumps__(), repeat('\r'))))
 
         log.info('DONE')
 
@@ -4,7 +4,6 @@ from collections import deque
 from . import asciibase
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
@@ -224,3 +223,164 @@ class AsciiTreeMixin(asciibase.AsciiBase):
         """
 
         return len(list(self.home()))
+
+
+class AsciiChildList(object):
+    """
+    Lightweight container used to store weak references to child objects.
+    Any additions or removals update the child's parent directly rather than through callbacks.
+    """
+
+    __slots__ = ('_owner', '_refs')
+
+    def __init__(self, owner):
+        """
+        Private method called after a new instance has been created.
+
+        :type owner: AsciiTreeMixin
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(AsciiChildList, self).__init__()
+
+        # Declare private variables
+        #
+        self._owner = owner.weakReference()
+        self._refs = []
+
+    def __getitem__(self, index):
+        """
+        Private method that returns an indexed child.
+
+        :type index: Union[int, slice]
+        :rtype: Union[AsciiTreeMixin, list[AsciiTreeMixin]]
+        """
+
+        if isinstance(index, slice):
+
+            return [ref() for ref in self._refs[index]]
+
+        else:
+
+            return self._refs[index]()
+
+    def __setitem__(self, index, child):
+        """
+        Private method that replaces an indexed child.
+
+        :type index: int
+        :type child: AsciiTreeMixin
+        :rtype: None
+        """
+
+        del self[index]
+
+        self._refs.insert(index, child.weakReference())
+        self.childAdded(child)
+
+    def __delitem__(self, index):
+        """
+        Private method that removes an indexed child.
+
+        :type index: int
+        :rtype: None
+        """
+
+        self.remove(self[index])
+
+    def __iter__(self):
+        """
+        Private method that returns a generator for the children.
+
+        :rtype: iter
+        """
+
+        for ref in self._refs:
+
+            yield ref()
+
+    def __len__(self):
+        """
+        Private method that evaluates the number of children.
+
+        :rtype: int
+        """
+
+        return len(self._refs)
+
+    def __contains__(self, child):
+        """
+        Private method that evaluates whether the supplied child exists in this container.
+
+        :type child: AsciiTreeMixin
+        :rtype: bool
+        """
+
+        return child.weakReference() in self._refs
+
+    def index(self, child):
+        """
+        Returns the index of the supplied child.
+
+        :type child: AsciiTreeMixin
+        :rtype: int
+        """
+
+        return self._refs.index(child.weakReference())
+
+    def append(self, child):
+        """
+        Appends the supplied child to the end of this container.
+
+        :type child: AsciiTreeMixin
+        :rtype: None
+        """
+
+        self._refs.append(child.weakReference())
+        self.childAdded(child)
+
+    def appendIfUnique(self, child):
+        """
+        Appends the supplied child only if it doesn't already exist.
+
+        :type child: AsciiTreeMixin
+        :rtype: None
+        """
+
+        if child not in self:
+
+            self.append(child)
+
+    def remove(self, child):
+        """
+        Removes the supplied child from this container.
+        If the child is still parented to the owner then the parent setter will call back into this method.
+
+        :type child: AsciiTreeMixin
+        :rtype: None
+        """
+
+        if child.parent is self._owner():
+
+            child.parent = None
+
+        else:
+
+            self._refs.remove(child.weakReference())
+
+    def childAdded(self, child):
+        """
+        Updates the parent of the supplied child.
+        The parent is only updated when out of sync to avoid recursing through the parent setter.
+
+        :type child: AsciiTreeMixin
+        :rtype: None
+        """
+
+        owner = self._owner()
+
+        if child.parent is not owner:
+
+            child.parent = owner
@@ -4,7 +4,6 @@ import shutil
 from . import asciifileparser
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
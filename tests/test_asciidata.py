@@ -0,0 +1,67 @@
+import numpy
+import pytest
+
+pytest.importorskip('maya.api.OpenMaya')
+
+from mason import asciidata
+
+
+def roundTrip(dataType, strings):
+    """
+    Reads the supplied strings, writes the result back to ascii and then reads it again.
+
+    :type dataType: Type[asciidata.AsciiData]
+    :type strings: list[str]
+    :rtype: tuple[Any, Any]
+    """
+
+    value = dataType.__readascii__(strings)[0]
+    copy = dataType.__readascii__(dataType.__writeascii__(value).split())[0]
+
+    return value, copy
+
+
+def test_rationalNurbsCurveRoundTrip():
+
+    strings = '3 1 0 yes 3 6 0 0 0 1 1 1 4 0 0 0 1 1 0 0 0.5 2 0 0 1 3 0 0 1'.split()
+    value, copy = roundTrip(asciidata.AsciiNurbsCurve, strings)
+
+    assert value['isRational'] is True
+    assert copy['isRational'] is True
+    assert copy['cvs'].shape == (4, 4)
+    assert numpy.array_equal(copy['cvs'], value['cvs'])
+    assert numpy.array_equal(copy['knots'], value['knots'])
+
+
+def test_nonRationalNurbsCurveRoundTrip():
+
+    strings = '1 1 0 no 3 2 0 1 2 0 0 0 1 0 0'.split()
+    value, copy = roundTrip(asciidata.AsciiNurbsCurve, strings)
+
+    assert copy['isRational'] is False
+    assert copy['cvs'].shape == (2, 3)
+    assert numpy.array_equal(copy['cvs'], value['cvs'])
+
+
+def test_rationalNurbsSurfaceRoundTrip():
+
+    strings = '1 1 0 0 yes 2 0 1 2 0 1 NOTRIM 4 0 0 0 1 1 0 0 1 0 1 0 0.5 1 1 0 1'.split()
+    value, copy = roundTrip(asciidata.AsciiNurbsSurface, strings)
+
+    assert copy['isRational'] is True
+    assert copy['cvs'].shape == (4, 4)
+    assert numpy.array_equal(copy['cvs'], value['cvs'])
+    assert copy['uKnots'] == value['uKnots'] and copy['vKnots'] == value['vKnots']
+
+
+
+@pytest.mark.parametrize('compensate', ['yes', 'no'])
+def test_xformMatrixRoundTrip(compensate):
+
+    strings = ['xform', '2', '3', '4', '0', '0', '0', '2'] + ['0'] * 18 + ['0', '0', '0', '1'] * 2 + ['1'] * 3 + [compensate]
+    value, copy = roundTrip(asciidata.AsciiMatrix, strings)
+
+    assert asciidata.AsciiMatrix.__writeascii__(value).endswith(f' {compensate}')
+    assert copy['compensateForParentScale'] is (compensate == 'yes')
+    assert copy['rotateOrder'] == value['rotateOrder'] == 2
+    assert all(numpy.array_equal(copy[key], value[key]) for key in asciidata.AsciiMatrix.__xform__)